@@ -0,0 +1,30 @@
+bl_info = {
+    "name": "Frosty Mesh Tools",
+    "author": "Clay MacDonald",
+    "version": (4, 0, 0),
+    "blender": (4, 0, 0),
+    "location": "View3D > Sidebar > Frosty Mesh",
+    "description": "Rename LODs, fix transforms, and export FBX meshes for Frostbite engine modding via Frosty Editor",
+    "doc_url": "https://github.com/claymcdonald/frosty-mesh-tools/wiki",
+    "category": "Object",
+}
+
+# Outside Blender (command line, core worker processes) only .core is usable
+try:
+    import bpy
+except ImportError:
+    bpy = None
+
+if bpy is not None:
+    if "addon" in locals():
+        import importlib
+        importlib.reload(core)
+        importlib.reload(addon)
+    else:
+        from . import core, addon
+
+    def register():
+        addon.register()
+
+    def unregister():
+        addon.unregister()
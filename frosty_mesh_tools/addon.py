@@ -0,0 +1,1556 @@
+"""Blender UI, operators and mesh processing for Frosty Mesh Tools."""
+
+import bpy
+import os
+import math
+import time
+import numpy as np
+from collections import OrderedDict
+from bpy.props import (
+    StringProperty, IntProperty, FloatProperty,
+    BoolProperty, EnumProperty, CollectionProperty, PointerProperty
+)
+from bpy.types import Operator, Panel, PropertyGroup, AddonPreferences
+from bpy_extras.io_utils import ImportHelper
+
+from . import bl_info
+from .core import (
+    is_mesh_res_file, scan_samples_folder, parse_mesh_res, resolve_vertex_format,
+    template_name_from_path, compare_template_folders, format_drift_report
+)
+
+# ============================================================================
+# TEMPLATE SCANNING
+# ============================================================================
+
+_cached_samples = []
+_cached_folder = ""
+
+
+def get_sample_items(self, context):
+    global _cached_samples, _cached_folder
+    settings = context.scene.frosty_lod_settings
+
+    if settings.samples_folder != _cached_folder:
+        _cached_folder = settings.samples_folder
+        _cached_samples = scan_samples_folder(settings.samples_folder)
+
+    items = [('NONE', "-- Select Template --", "Choose a mesh.res template")]
+    for display_name, filepath in _cached_samples:
+        items.append((filepath, display_name, f"Load: {display_name}"))
+    if len(items) == 1:
+        items.append(('NO_SAMPLES', "(No templates found)", ""))
+    return items
+
+
+def on_sample_selected(self, context):
+    settings = context.scene.frosty_lod_settings
+    if settings.selected_sample not in ('NONE', 'NO_SAMPLES', ''):
+        if os.path.exists(settings.selected_sample):
+            load_template(context, settings.selected_sample)
+
+
+def on_samples_folder_changed(self, context):
+    global _cached_folder
+    _cached_folder = ""
+
+
+# ============================================================================
+# COLLECTION MANAGEMENT
+# ============================================================================
+
+def get_or_create_collection(name):
+    """Get an existing collection by name or create a new one under the scene."""
+    if name in bpy.data.collections:
+        col = bpy.data.collections[name]
+        if col.name not in bpy.context.scene.collection.children:
+            bpy.context.scene.collection.children.link(col)
+        return col
+
+    col = bpy.data.collections.new(name)
+    bpy.context.scene.collection.children.link(col)
+    return col
+
+
+def link_object_to_collection(obj, collection):
+    """Move an object into a collection, removing it from others."""
+    for col in obj.users_collection:
+        col.objects.unlink(obj)
+    collection.objects.link(obj)
+
+
+# ============================================================================
+# TEMPLATE LOADING
+# ============================================================================
+
+def load_template(context, filepath):
+    """Load a mesh.res template and create a collection."""
+    settings = context.scene.frosty_lod_settings
+    prefs = context.preferences.addons[__package__].preferences
+
+    if not is_mesh_res_file(filepath):
+        return False, "Not a valid mesh.res file"
+
+    try:
+        material_info, lod_sections, mesh_path = parse_mesh_res(filepath)
+    except Exception as e:
+        return False, f"Parse error: {str(e)}"
+
+    if not material_info:
+        return False, "No materials found"
+
+    settings.template_path = filepath
+    settings.template_mesh_path = mesh_path
+    settings.template_name = template_name_from_path(filepath)
+
+    if prefs.remember_last_template:
+        prefs.last_template_path = filepath
+
+    # Store material info
+    settings.material_slots.clear()
+    for mat_name in sorted(material_info.keys()):
+        min_lod, max_lod = material_info[mat_name]
+        slot = settings.material_slots.add()
+        slot.name = mat_name
+        slot.min_lod = min_lod
+        slot.max_lod = max_lod
+
+    # Create collection for this mesh
+    get_or_create_collection(settings.template_name)
+
+    print(f"Loaded template: {settings.template_name} ({len(material_info)} materials)")
+    return True, f"Loaded {len(material_info)} materials"
+
+
+# ============================================================================
+# UTILITY FUNCTIONS
+# ============================================================================
+
+def find_armature(obj):
+    """Find armature for an object."""
+    if obj.parent and obj.parent.type == 'ARMATURE':
+        return obj.parent
+    for mod in obj.modifiers:
+        if mod.type == 'ARMATURE' and mod.object:
+            return mod.object
+    return None
+
+
+def get_template_collection(settings):
+    """Get the template collection."""
+    if settings.template_name and settings.template_name in bpy.data.collections:
+        return bpy.data.collections[settings.template_name]
+    return None
+
+
+def get_meshes_from_template_collection(settings):
+    """Get all mesh objects from the template collection."""
+    col = get_template_collection(settings)
+    if not col:
+        return []
+    return [obj for obj in col.objects if obj.type == 'MESH']
+
+
+def get_slot_label(settings, obj):
+    """Get the material slot name an object is assigned to, or its own name."""
+    for slot in settings.material_slots:
+        if slot.mesh_object == obj:
+            return slot.name
+    return obj.name
+
+
+# ============================================================================
+# VERTEX WELDING
+# ============================================================================
+
+def read_corner_normals(mesh):
+    """Read per-loop normals as an (N, 3) array."""
+    normals = np.empty(len(mesh.loops) * 3, dtype=np.float32)
+    if hasattr(mesh, "corner_normals"):
+        # Blender 4.1+
+        mesh.corner_normals.foreach_get("vector", normals)
+    else:
+        mesh.calc_normals_split()
+        mesh.loops.foreach_get("normal", normals)
+    return normals.reshape(-1, 3)
+
+
+def _quantize(values, epsilon):
+    """Bucket values into multiples of epsilon.
+
+    Values in the same bucket are always within epsilon of each other, but
+    values within epsilon can still straddle a bucket boundary, so this only
+    approximates "within epsilon": it never merges values further apart, and
+    may miss a few pairs that are close enough.
+    """
+    return np.round(values / epsilon).astype(np.int64)
+
+
+def _unique_rows(columns):
+    """Return (first_index, inverse) for the unique rows of the stacked columns."""
+    keys = np.ascontiguousarray(np.column_stack(columns), dtype=np.int64)
+    rows = keys.view(np.dtype((np.void, keys.dtype.itemsize * keys.shape[1]))).ravel()
+    _, first, inverse = np.unique(rows, return_index=True, return_inverse=True)
+    return first, inverse.ravel()
+
+
+def _weight_signature(snapshot, vertex, epsilon):
+    start, end = snapshot['weight_offsets'][vertex:vertex + 2].tolist()
+    groups = snapshot['weight_groups'][start:end].tolist()
+    weights = snapshot['weight_values'][start:end].tolist()
+    return tuple(sorted(
+        (group, round(weight / epsilon)) for group, weight in zip(groups, weights) if weight > 0.0
+    ))
+
+
+def count_export_vertices(snapshot, attribute_indices, epsilon):
+    """Count unique (vertex, normal, UV, color) corner tuples - the exported vertex count."""
+    corners = snapshot['triangles'].ravel()
+    if not len(corners):
+        return 0
+    columns = [snapshot['loop_verts'][corners], _quantize(snapshot['normals'][corners], epsilon)]
+    for index in attribute_indices:
+        attr_info = snapshot['attributes'][index]
+        if attr_info['role'] in {'UV', 'COLOR'} and attr_info['domain'] == 'CORNER':
+            columns.append(_quantize(snapshot['attribute_values'][index][corners], epsilon))
+    first, _ = _unique_rows(columns)
+    return len(first)
+
+
+def find_weld_targets(snapshot, attribute_indices, epsilon):
+    """Map every vertex to the vertex it can be welded into (itself if none).
+
+    Vertices weld when their positions match within epsilon, every corner of
+    both vertices shares the same normal, their exported per-vertex
+    attributes (colors, custom attributes) match and their bone weights
+    match. UVs and corner colors are per-corner so their seams survive the
+    weld untouched.
+    """
+    loop_verts = snapshot['loop_verts']
+    vert_count = len(snapshot['co'])
+    qnormals = _quantize(snapshot['normals'], epsilon)
+
+    # Vertices on hard edges or with split normals keep their identity
+    vert_normals = np.zeros((vert_count, 3), dtype=np.int64)
+    used, first_corner = np.unique(loop_verts, return_index=True)
+    vert_normals[used] = qnormals[first_corner]
+    smooth = np.ones(vert_count, dtype=bool)
+    split = np.any(qnormals != vert_normals[loop_verts], axis=1)
+    smooth[loop_verts[split]] = False
+
+    tag = np.where(smooth, -1, np.arange(vert_count))
+    columns = [_quantize(snapshot['co'], epsilon), vert_normals, tag]
+    columns.extend(
+        _quantize(snapshot['attribute_values'][index], epsilon) for index in attribute_indices
+        if snapshot['attributes'][index]['domain'] == 'POINT'
+    )
+    first, inverse = _unique_rows(columns)
+    targets = first[inverse]
+
+    # Bone weights vary in length per vertex; only compare the duplicates
+    candidates = np.flatnonzero(targets != np.arange(vert_count))
+    if len(candidates):
+        representatives = {}
+        for index in np.union1d(candidates, targets[candidates]).tolist():
+            key = (int(targets[index]), _weight_signature(snapshot, index, epsilon))
+            targets[index] = representatives.setdefault(key, index)
+
+    return targets
+
+
+def weld_snapshot(snapshot, attribute_indices, epsilon):
+    """Weld duplicate vertices in a copy of a snapshot, leaving the cached one untouched.
+
+    Triangles that collapse are dropped. Returns (welded snapshot,
+    vertices_before, vertices_after) where the vertex counts are unique
+    corner tuples, as written to the vertex buffer.
+    """
+    targets = find_weld_targets(snapshot, attribute_indices, epsilon)
+    before = count_export_vertices(snapshot, attribute_indices, epsilon)
+
+    welded = dict(snapshot)
+    welded['loop_verts'] = targets[snapshot['loop_verts']]
+    tri_verts = welded['loop_verts'][snapshot['triangles']]
+    keep = (
+        (tri_verts[:, 0] != tri_verts[:, 1])
+        & (tri_verts[:, 1] != tri_verts[:, 2])
+        & (tri_verts[:, 2] != tri_verts[:, 0])
+    )
+    welded['triangles'] = snapshot['triangles'][keep]
+    welded['triangle_polygons'] = snapshot['triangle_polygons'][keep]
+
+    after = count_export_vertices(welded, attribute_indices, epsilon)
+    return welded, before, after
+
+
+# ============================================================================
+# EVALUATED MESH CACHE
+# ============================================================================
+
+# Per-object revision counters, bumped whenever the depsgraph re-evaluates
+# an object's geometry (mesh edits, modifier changes, modifier targets moving).
+_object_revisions = {}
+
+# Attributes rebuilt from dedicated snapshot arrays, or derived by Blender
+BUILTIN_ATTRIBUTES = {
+    "position", "sharp_face", "sharp_edge", "material_index", "custom_normal",
+    "crease_vert", "crease_edge", "bevel_weight_vert", "bevel_weight_edge",
+}
+
+# data_type: (foreach_get property, values per element, dtype)
+ATTRIBUTE_LAYOUTS = {
+    'FLOAT': ("value", 1, np.float32),
+    'INT': ("value", 1, np.int32),
+    'INT8': ("value", 1, np.int32),
+    'BOOLEAN': ("value", 1, bool),
+    'FLOAT2': ("vector", 2, np.float32),
+    'INT32_2D': ("value", 2, np.int32),
+    'FLOAT_VECTOR': ("vector", 3, np.float32),
+    'FLOAT_COLOR': ("color", 4, np.float32),
+    'BYTE_COLOR': ("color", 4, np.float32),
+    'QUATERNION': ("value", 4, np.float32),
+    'FLOAT4X4': ("value", 16, np.float32),
+}
+
+
+@bpy.app.handlers.persistent
+def on_depsgraph_update(scene, depsgraph):
+    """Track geometry updates so cached snapshots are only invalidated on change."""
+    for update in depsgraph.updates:
+        if isinstance(update.id, bpy.types.Object) and update.is_updated_geometry:
+            key = update.id.original.session_uid
+            _object_revisions[key] = _object_revisions.get(key, 0) + 1
+
+
+@bpy.app.handlers.persistent
+def on_file_or_undo(*args):
+    """Drop all cached snapshots after loading a file or undo/redo."""
+    _object_revisions.clear()
+    _mesh_cache.clear()
+
+
+def read_vertex_weights(mesh, vertex_group_names):
+    """Read deform weights as CSR arrays (offsets per vertex, group indices, weights).
+
+    Vertex weights have no foreach_get access, this is the slow part of a snapshot.
+    """
+    counts = np.zeros(len(mesh.vertices) + 1, dtype=np.int64)
+    if not vertex_group_names:
+        return counts, np.empty(0, dtype=np.int32), np.empty(0, dtype=np.float32)
+    groups = []
+    weights = []
+    for vertex in mesh.vertices:
+        vertex_groups = vertex.groups
+        counts[vertex.index + 1] = len(vertex_groups)
+        for g in vertex_groups:
+            groups.append(g.group)
+            weights.append(g.weight)
+    return (
+        np.cumsum(counts),
+        np.array(groups, dtype=np.int32),
+        np.array(weights, dtype=np.float32),
+    )
+
+
+def snapshot_mesh(mesh, vertex_group_names):
+    """Read an evaluated mesh into numpy arrays, enough to rebuild it for export."""
+    domain_sizes = {'POINT': len(mesh.vertices), 'FACE': len(mesh.polygons), 'CORNER': len(mesh.loops)}
+
+    loop_verts = np.empty(len(mesh.loops), dtype=np.int64)
+    mesh.loops.foreach_get("vertex_index", loop_verts)
+
+    co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", co)
+
+    material_indices = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get("material_index", material_indices)
+
+    smooth = np.empty(len(mesh.polygons), dtype=bool)
+    mesh.polygons.foreach_get("use_smooth", smooth)
+
+    mesh.calc_loop_triangles()
+    triangles = np.empty(len(mesh.loop_triangles) * 3, dtype=np.int32)
+    mesh.loop_triangles.foreach_get("loops", triangles)
+    triangle_polygons = np.empty(len(mesh.loop_triangles), dtype=np.int32)
+    mesh.loop_triangles.foreach_get("polygon_index", triangle_polygons)
+
+    # UV maps, color attributes and custom attributes. Edge attributes are
+    # left out, the rebuilt mesh has its own edges.
+    uv_names = {layer.name for layer in mesh.uv_layers}
+    render_uv = next((layer.name for layer in mesh.uv_layers if layer.active_render), None)
+    color_names = {attr.name for attr in mesh.color_attributes}
+    render_index = mesh.color_attributes.render_color_index
+    render_color = mesh.color_attributes[render_index].name if 0 <= render_index < len(mesh.color_attributes) else None
+
+    attributes = []
+    attribute_values = []
+    for attr in mesh.attributes:
+        if attr.is_internal or attr.is_required or attr.name.startswith(".") or attr.name in BUILTIN_ATTRIBUTES:
+            continue
+        layout = ATTRIBUTE_LAYOUTS.get(attr.data_type)
+        if layout is None or attr.domain not in domain_sizes:
+            continue
+        prop, width, dtype = layout
+        values = np.empty(domain_sizes[attr.domain] * width, dtype=dtype)
+        attr.data.foreach_get(prop, values)
+
+        if attr.name in uv_names:
+            role, render = 'UV', attr.name == render_uv
+        elif attr.name in color_names:
+            role, render = 'COLOR', attr.name == render_color
+        else:
+            role, render = 'CUSTOM', False
+        attributes.append({
+            'name': attr.name,
+            'domain': attr.domain,
+            'data_type': attr.data_type,
+            'role': role,
+            'render': render,
+        })
+        attribute_values.append(values.reshape(domain_sizes[attr.domain], width))
+
+    weight_offsets, weight_groups, weight_values = read_vertex_weights(mesh, vertex_group_names)
+
+    return {
+        'co': co.reshape(-1, 3),
+        'loop_verts': loop_verts,
+        'normals': read_corner_normals(mesh),
+        'material_indices': material_indices,
+        'smooth': smooth,
+        'triangles': triangles.reshape(-1, 3),
+        'triangle_polygons': triangle_polygons,
+        'attributes': attributes,
+        'attribute_values': attribute_values,
+        'weight_offsets': weight_offsets,
+        'weight_groups': weight_groups,
+        'weight_values': weight_values,
+        'vertex_group_names': list(vertex_group_names),
+        'materials': [mat.original if mat else None for mat in mesh.materials],
+    }
+
+
+def snapshot_nbytes(snapshot):
+    """Memory used by a snapshot's arrays."""
+    total = 0
+    for value in snapshot.values():
+        if isinstance(value, np.ndarray):
+            total += value.nbytes
+        elif isinstance(value, list):
+            total += sum(item.nbytes for item in value if isinstance(item, np.ndarray))
+    return total
+
+
+class EvaluatedMeshCache:
+    """LRU cache of evaluated mesh snapshots with a memory cap.
+
+    Entries are keyed by the object's session UID and tagged with its
+    revision and the scene frame, so a snapshot is only re-evaluated when
+    the object changed or the frame moved (animated deformation).
+    """
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self._entries = OrderedDict()
+
+    def _tag(self, key, frame):
+        return (_object_revisions.get(key, 0), frame)
+
+    def get(self, obj, frame):
+        """Get an object's snapshot, or None if it isn't cached or is out of date."""
+        key = obj.original.session_uid
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == self._tag(key, frame):
+            self._entries.move_to_end(key)
+            return entry[1]
+        return None
+
+    def put(self, obj, frame, snapshot):
+        key = obj.original.session_uid
+        self.discard(key)
+        size = snapshot_nbytes(snapshot)
+        if size > self.max_bytes:
+            return
+        self._entries[key] = (self._tag(key, frame), snapshot, size)
+        self.nbytes += size
+        self.evict()
+
+    def evict(self):
+        """Drop least recently used snapshots until under the memory cap."""
+        while self.nbytes > self.max_bytes and self._entries:
+            _, (_, _, size) = self._entries.popitem(last=False)
+            self.nbytes -= size
+
+    def discard(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.nbytes -= entry[2]
+
+    def clear(self):
+        self._entries.clear()
+        self.nbytes = 0
+
+
+_mesh_cache = EvaluatedMeshCache(512 * 1024 * 1024)
+
+
+def get_mesh_cache(context):
+    """Get the shared evaluated mesh cache, sized from the addon preferences."""
+    prefs = context.preferences.addons[__package__].preferences
+    _mesh_cache.max_bytes = prefs.mesh_cache_size * 1024 * 1024
+    _mesh_cache.evict()
+    return _mesh_cache
+
+
+# ============================================================================
+# EXPORT COPIES
+# ============================================================================
+
+EXPORT_SOURCE_SUFFIX = ".frosty_src"
+
+
+def get_export_vertex_format(settings):
+    """Get the vertex channels the loaded template consumes.
+
+    Derived from the template, or its profile. Returns None when neither
+    defines it, in which case nothing should be pruned.
+    """
+    try:
+        return resolve_vertex_format(bpy.path.abspath(settings.template_path))
+    except (OSError, ValueError) as e:
+        print(f"[FrostyMeshTools] Warning: Could not read vertex profile: {e}")
+        return None
+
+
+def fbx_layer_nbytes(values, corner_count):
+    """Approximate FBX size of a UV or color layer.
+
+    The exporter writes both as IndexToDirect layers: the unique values as
+    doubles plus an int32 index per corner.
+    """
+    unique_count = len(np.unique(values, axis=0)) if len(values) else 0
+    return unique_count * values.shape[1] * 8 + corner_count * 4
+
+
+def select_export_attributes(snapshot, vertex_format):
+    """Pick the snapshot attributes the vertex format uses.
+
+    Channel counts of None keep every layer of that kind, and a vertex
+    format of None keeps everything. Returns (attribute indices, FBX bytes
+    pruned); custom attributes count for nothing, the FBX exporter doesn't
+    write them.
+    """
+    attributes = snapshot['attributes']
+    if vertex_format is None:
+        return list(range(len(attributes))), 0
+
+    keep = []
+    for role, limit in (('UV', vertex_format['uv_channels']), ('COLOR', vertex_format['color_channels'])):
+        # Keep the render UV map and color first, they're the ones shaders read
+        indices = [i for i, attr in enumerate(attributes) if attr['role'] == role]
+        indices.sort(key=lambda i: not attributes[i]['render'])
+        keep.extend(indices if limit is None else indices[:limit])
+    keep.extend(
+        i for i, attr in enumerate(attributes)
+        if attr['role'] == 'CUSTOM' and attr['name'] in vertex_format['attributes']
+    )
+    keep.sort()
+
+    corner_count = snapshot['triangles'].size
+    pruned = sum(
+        fbx_layer_nbytes(values, corner_count)
+        for i, values in enumerate(snapshot['attribute_values'])
+        if i not in keep and attributes[i]['role'] in {'UV', 'COLOR'}
+    )
+    return keep, pruned
+
+
+def build_export_mesh(name, snapshot, attribute_indices):
+    """Build a triangulated mesh from a snapshot with foreach_set.
+
+    Returns (mesh, used_vertices) where used_vertices maps the new vertex
+    indices to snapshot vertices, for write_vertex_weights.
+    """
+    corners = snapshot['triangles'].ravel()
+    triangle_count = len(snapshot['triangles'])
+
+    # Loose vertices are dropped, only vertices used by triangles are exported
+    used_vertices, loop_verts = np.unique(snapshot['loop_verts'][corners], return_inverse=True)
+
+    mesh = bpy.data.meshes.new(name)
+    mesh.vertices.add(len(used_vertices))
+    mesh.vertices.foreach_set("co", snapshot['co'][used_vertices].ravel())
+    mesh.loops.add(len(corners))
+    mesh.loops.foreach_set("vertex_index", loop_verts.astype(np.int32))
+    mesh.polygons.add(triangle_count)
+    mesh.polygons.foreach_set("loop_start", np.arange(0, len(corners), 3, dtype=np.int32))
+    if not bpy.types.MeshPolygon.bl_rna.properties["loop_total"].is_readonly:
+        mesh.polygons.foreach_set("loop_total", np.full(triangle_count, 3, dtype=np.int32))
+    mesh.polygons.foreach_set("material_index", snapshot['material_indices'][snapshot['triangle_polygons']])
+    mesh.polygons.foreach_set("use_smooth", snapshot['smooth'][snapshot['triangle_polygons']])
+    mesh.update(calc_edges=True)
+
+    for mat in snapshot['materials']:
+        mesh.materials.append(mat)
+
+    domain_indices = {'POINT': used_vertices, 'FACE': snapshot['triangle_polygons'], 'CORNER': corners}
+    for index in attribute_indices:
+        attr_info = snapshot['attributes'][index]
+        values = snapshot['attribute_values'][index][domain_indices[attr_info['domain']]]
+
+        if attr_info['role'] == 'UV':
+            layer = mesh.uv_layers.new(name=attr_info['name'], do_init=False)
+            layer.active_render = attr_info['render']
+        elif attr_info['role'] == 'COLOR':
+            mesh.color_attributes.new(attr_info['name'], attr_info['data_type'], attr_info['domain'])
+            if attr_info['render']:
+                mesh.color_attributes.render_color_index = mesh.color_attributes.find(attr_info['name'])
+        else:
+            mesh.attributes.new(attr_info['name'], attr_info['data_type'], attr_info['domain'])
+
+        prop = ATTRIBUTE_LAYOUTS[attr_info['data_type']][0]
+        mesh.attributes[attr_info['name']].data.foreach_set(prop, values.ravel())
+
+    # Keep the evaluated shading exactly
+    if hasattr(mesh, "use_auto_smooth"):
+        # Blender 4.0
+        mesh.use_auto_smooth = True
+    mesh.normals_split_custom_set(snapshot['normals'][corners])
+
+    return mesh, used_vertices
+
+
+def write_vertex_weights(obj, snapshot, used_vertices):
+    """Create the snapshot's vertex groups on obj (and its mesh) and write the weights."""
+    offsets = snapshot['weight_offsets']
+    counts = np.diff(offsets)[used_vertices]
+    if not counts.sum():
+        return
+
+    # Gather the weight entries of the used vertices, with their new indices
+    starts = np.repeat(offsets[used_vertices], counts)
+    entry = starts + np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    vertices = np.repeat(np.arange(len(used_vertices)), counts)
+    groups = snapshot['weight_groups'][entry]
+    weights = snapshot['weight_values'][entry]
+
+    vertex_groups = [obj.vertex_groups.new(name=name) for name in snapshot['vertex_group_names']]
+
+    # VertexGroup.add takes one weight per call, so batch vertices by weight
+    order = np.lexsort((weights, groups))
+    groups, weights, vertices = groups[order], weights[order], vertices[order]
+    keys = np.column_stack((groups, weights.view(np.int32)))
+    _, starts = np.unique(keys, axis=0, return_index=True)
+    ends = np.append(starts[1:], len(groups))
+    for start, end in zip(starts.tolist(), ends.tolist()):
+        group = int(groups[start])
+        if group < len(vertex_groups):
+            vertex_groups[group].add(vertices[start:end].tolist(), float(weights[start]), 'REPLACE')
+
+
+# Modifier properties that don't change the evaluated mesh
+MODIFIER_IGNORED_PROPERTIES = {
+    "name", "show_expanded", "show_viewport", "show_render", "show_in_editmode",
+    "show_on_cage", "is_active", "use_pin_to_last", "is_override_data_editable",
+    "persistent_uid", "use_apply_on_spline",
+}
+
+
+# Nodes whose output depends on the evaluated object's transform
+TRANSFORM_DEPENDENT_NODES = {
+    "GeometryNodeSelfObject", "GeometryNodeObjectInfo", "GeometryNodeCollectionInfo",
+}
+
+
+def node_tree_reads_transforms(node_tree, visited=None):
+    """Whether a node tree, or a node group inside it, reads object transforms."""
+    visited = set() if visited is None else visited
+    if node_tree in visited:
+        return False
+    visited.add(node_tree)
+    for node in node_tree.nodes:
+        if node.bl_idname in TRANSFORM_DEPENDENT_NODES:
+            return True
+        if node.type == 'GROUP' and node.node_tree and node_tree_reads_transforms(node.node_tree, visited):
+            return True
+    return False
+
+
+def _id_property_key(value):
+    """Hashable form of an ID property value, or None if it references an object or collection."""
+    if isinstance(value, (bpy.types.Object, bpy.types.Collection)):
+        return None
+    if isinstance(value, bpy.types.ID):
+        return value.name_full
+    if hasattr(value, "to_list"):
+        return tuple(value.to_list())
+    if hasattr(value, "keys"):
+        items = []
+        for key in sorted(value.keys()):
+            item = _id_property_key(value[key])
+            if item is None:
+                return None
+            items.append((key, item))
+        return tuple(items)
+    return value
+
+
+def get_shared_data_key(obj):
+    """Key identifying objects whose evaluated mesh is identical.
+
+    Objects share a key when they use the same mesh data, the same modifier
+    stack (armatures aside), the same vertex group names and the same
+    object-linked materials. Stacks that read other objects or collections,
+    global texture coordinates, or node groups with Self Object, Object Info
+    or Collection Info nodes depend on this object's transform, so they are
+    never shared.
+    """
+    stack = []
+    for mod in obj.modifiers:
+        if mod.type == 'ARMATURE' or not mod.show_viewport:
+            continue
+        if getattr(mod, "texture_coords", None) == 'GLOBAL':
+            return (obj.session_uid,)
+        values = [mod.type]
+        for prop in mod.bl_rna.properties:
+            if prop.is_readonly or prop.identifier in MODIFIER_IGNORED_PROPERTIES:
+                continue
+            value = getattr(mod, prop.identifier)
+            if prop.type == 'POINTER':
+                if value is None:
+                    pass
+                elif isinstance(value, (bpy.types.Object, bpy.types.Collection)) or not isinstance(value, bpy.types.ID):
+                    return (obj.session_uid,)
+                elif isinstance(value, bpy.types.NodeTree) and node_tree_reads_transforms(value):
+                    return (obj.session_uid,)
+                else:
+                    value = value.name_full
+            elif prop.type == 'COLLECTION':
+                continue
+            elif prop.type == 'ENUM' and prop.is_enum_flag:
+                value = frozenset(value)
+            elif getattr(prop, "is_array", False):
+                value = tuple(value)
+            values.append((prop.identifier, value))
+
+        # Geometry Nodes inputs are ID properties, not RNA properties
+        for key in sorted(mod.keys()):
+            value = _id_property_key(mod[key])
+            if value is None:
+                return (obj.session_uid,)
+            values.append((key, value))
+        stack.append(tuple(values))
+
+    object_materials = tuple(
+        slot.material.name_full if slot.material else None
+        for slot in obj.material_slots if slot.link == 'OBJECT'
+    )
+    # Modifiers look vertex groups up by name through the object's list
+    vertex_groups = tuple(group.name for group in obj.vertex_groups)
+    return (obj.data.session_uid, tuple(stack), vertex_groups, object_materials)
+
+
+def get_export_snapshots(context, copies, share=True):
+    """Get a rest pose snapshot for every group of objects with identical evaluated meshes.
+
+    Groups are keyed by get_shared_data_key (or one group per object with
+    share disabled). A group is served from the cache if any of its objects
+    is cached; otherwise its first object's copy is evaluated, with armature
+    modifiers disabled, and the result is cached.
+
+    Returns (list of (snapshot, [original objects]), number of groups
+    served from the cache).
+    """
+    cache = get_mesh_cache(context)
+    frame = context.scene.frame_current
+
+    groups = {}
+    for obj in copies:
+        key = get_shared_data_key(obj) if share else (obj.session_uid,)
+        groups.setdefault(key, []).append(obj)
+
+    snapshots = {}
+    missing = []
+    for key, users in groups.items():
+        for obj in users:
+            snapshot = cache.get(obj, frame)
+            if snapshot is not None:
+                snapshots[key] = snapshot
+                break
+        else:
+            missing.append(key)
+
+    if missing:
+        # Evaluate in rest pose; the armature modifiers stay on the copies for skinning
+        armature_mods = [
+            mod for key in missing for mod in copies[groups[key][0]][0].modifiers
+            if mod.type == 'ARMATURE' and mod.show_viewport
+        ]
+        for mod in armature_mods:
+            mod.show_viewport = False
+        try:
+            depsgraph = context.evaluated_depsgraph_get()
+            for key in missing:
+                obj = groups[key][0]
+                copy_eval = copies[obj][0].evaluated_get(depsgraph)
+                mesh = copy_eval.to_mesh(preserve_all_data_layers=True, depsgraph=depsgraph)
+                try:
+                    snapshot = snapshot_mesh(mesh, [group.name for group in copy_eval.vertex_groups])
+                finally:
+                    copy_eval.to_mesh_clear()
+                cache.put(obj, frame, snapshot)
+                snapshots[key] = snapshot
+        finally:
+            for mod in armature_mods:
+                mod.show_viewport = True
+
+    groups = [(snapshots[key], users) for key, users in groups.items()]
+    return groups, len(groups) - len(missing)
+
+
+def create_export_copies(objects, collection):
+    """Duplicate objects for export, taking over the original names.
+
+    Frosty matches meshes by name, so the originals are renamed until
+    remove_export_copies restores them.
+    """
+    copies = {}
+    for obj in objects:
+        name = obj.name
+        copy = obj.copy()
+        obj.name = name + EXPORT_SOURCE_SUFFIX
+        copy.name = name
+        collection.objects.link(copy)
+        copies[obj] = (copy, name)
+    return copies
+
+
+def assign_export_mesh(copies, users, mesh, snapshot, used_vertices):
+    """Give the copies of users a built export mesh, leaving only armature modifiers.
+
+    All users get the same mesh, so the FBX exporter writes it (and computes
+    its tangents) once.
+    """
+    for index, obj in enumerate(users):
+        copy = copies[obj][0]
+        copy.data = mesh
+        if index == 0:
+            # Vertex group names live on the mesh
+            write_vertex_weights(copy, snapshot, used_vertices)
+        for mod in [mod for mod in copy.modifiers if mod.type != 'ARMATURE']:
+            copy.modifiers.remove(mod)
+
+
+def remove_export_copies(copies):
+    """Delete export copies and give the originals their names back."""
+    for obj, (copy, name) in copies.items():
+        # The copies' revisions are never looked up again
+        _object_revisions.pop(copy.session_uid, None)
+        mesh = copy.data
+        bpy.data.objects.remove(copy)
+        if mesh.users == 0:
+            bpy.data.meshes.remove(mesh)
+        obj.name = name
+
+
+def format_bytes(size):
+    for unit in ("B", "KB", "MB"):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+
+# ============================================================================
+# PROPERTY GROUPS
+# ============================================================================
+
+class MaterialSlotItem(PropertyGroup):
+    name: StringProperty(name="Material Name")
+    mesh_object: PointerProperty(name="Mesh", type=bpy.types.Object)
+    min_lod: IntProperty(name="Min LOD", default=0, min=0, max=7)
+    max_lod: IntProperty(name="Max LOD", default=4, min=0, max=7)
+
+
+class FrostyLODSettings(PropertyGroup):
+    # Template settings
+    template_path: StringProperty(name="Template Path", subtype='FILE_PATH')
+    template_name: StringProperty(name="Template Name", default="")
+    template_mesh_path: StringProperty(name="Mesh Path", default="")
+    samples_folder: StringProperty(
+        name="Templates Folder",
+        subtype='DIR_PATH',
+        update=lambda s, c: on_samples_folder_changed(s, c)
+    )
+    drift_baseline_folder: StringProperty(
+        name="Baseline Folder",
+        description="Older templates folder to compare against. Leave empty to compare against the last snapshot",
+        subtype='DIR_PATH'
+    )
+    selected_sample: EnumProperty(
+        name="Template",
+        items=get_sample_items,
+        update=lambda s, c: on_sample_selected(s, c)
+    )
+
+    # Material slots (from template)
+    material_slots: CollectionProperty(type=MaterialSlotItem)
+
+    # Export settings
+    export_path: StringProperty(name="Export Path", subtype='DIR_PATH', default="//")
+    export_name: StringProperty(name="Export Name", default="mesh")
+    export_scale: FloatProperty(name="Scale", default=1.0, min=0.001, max=100.0)
+    prune_attributes: BoolProperty(
+        name="Prune Unused Attributes",
+        description="Export without the UV maps, color attributes and custom attributes the template's vertex format doesn't use. Your meshes are not modified",
+        default=True
+    )
+    share_mesh_data: BoolProperty(
+        name="Share Linked Mesh Data",
+        description="Evaluate, triangulate and write objects sharing mesh data and modifier stacks once",
+        default=True
+    )
+    weld_on_export: BoolProperty(
+        name="Weld Duplicate Vertices",
+        description="Weld duplicate vertices with identical attributes on export. Your meshes are not modified",
+        default=False
+    )
+    weld_epsilon: FloatProperty(
+        name="Weld Epsilon",
+        description="Distance within which positions, normals, UVs and weights are treated as identical",
+        default=0.00001,
+        min=0.0000001,
+        max=0.1,
+        precision=6
+    )
+
+    # UI state
+    active_tab: EnumProperty(
+        name="Tab",
+        items=[
+            ('TEMPLATE', "Template", "Template loading"),
+            ('RENAME', "Rename", "LOD renaming"),
+            ('TRANSFORM', "Transform", "Transform fix"),
+            ('EXPORT', "Export", "FBX export"),
+        ],
+        default='TEMPLATE'
+    )
+
+    # Misc
+    auto_rename_meshes: BoolProperty(
+        name="Auto-rename on assign",
+        description="Rename meshes to materialname:lod0 format when assigned",
+        default=True
+    )
+
+
+class FrostyPreferences(AddonPreferences):
+    bl_idname = __package__
+
+    remember_last_template: BoolProperty(
+        name="Remember Last Template",
+        description="Auto-load last used template on startup",
+        default=True
+    )
+    last_template_path: StringProperty(name="Last Template", subtype='FILE_PATH')
+    mesh_cache_size: IntProperty(
+        name="Mesh Cache Size (MB)",
+        description="Memory limit for evaluated meshes cached between exports",
+        default=512,
+        min=0,
+        max=16384
+    )
+
+    def draw(self, context):
+        layout = self.layout
+        layout.prop(self, "remember_last_template")
+        layout.prop(self, "mesh_cache_size")
+
+
+# ============================================================================
+# OPERATORS
+# ============================================================================
+
+class FROSTY_OT_load_template(Operator, ImportHelper):
+    bl_idname = "frosty.load_template"
+    bl_label = "Load Template"
+    bl_description = "Load a mesh.res template file"
+
+    filename_ext = ".res"
+    filter_glob: StringProperty(default="*_mesh.res;*.res", options={'HIDDEN'})
+
+    def execute(self, context):
+        success, message = load_template(context, self.filepath)
+        self.report({'INFO' if success else 'ERROR'}, message)
+        return {'FINISHED'} if success else {'CANCELLED'}
+
+
+class FROSTY_OT_check_template_drift(Operator):
+    bl_idname = "frosty.check_template_drift"
+    bl_label = "Check Template Drift"
+    bl_description = "Report material and LOD range changes across the templates folder and flag affected collections"
+
+    # Not registered for redo, re-running from the redo panel would overwrite the snapshot
+    update_snapshot: BoolProperty(
+        name="Update Snapshot",
+        description="Save the current templates as the snapshot to compare against next time",
+        default=False,
+        options={'SKIP_SAVE', 'HIDDEN'}
+    )
+
+    @classmethod
+    def poll(cls, context):
+        settings = context.scene.frosty_lod_settings
+        return bool(settings.samples_folder)
+
+    def execute(self, context):
+        settings = context.scene.frosty_lod_settings
+        folder = bpy.path.abspath(settings.samples_folder)
+        baseline_folder = bpy.path.abspath(settings.drift_baseline_folder) if settings.drift_baseline_folder else None
+
+        if not os.path.isdir(folder):
+            self.report({'ERROR'}, "Templates folder not found")
+            return {'CANCELLED'}
+        if baseline_folder and not os.path.isdir(baseline_folder):
+            self.report({'ERROR'}, "Baseline folder not found")
+            return {'CANCELLED'}
+
+        start = time.perf_counter()
+        try:
+            diffs, entries = compare_template_folders(folder, baseline_folder, update=self.update_snapshot)
+        except OSError as e:
+            self.report({'ERROR'}, f"Drift check failed: {e}")
+            return {'CANCELLED'}
+        elapsed = time.perf_counter() - start
+
+        if diffs is None:
+            if self.update_snapshot:
+                self.report({'INFO'}, f"Created snapshot of {len(entries)} templates ({elapsed:.2f}s)")
+            else:
+                self.report({'WARNING'}, "No snapshot of the templates folder yet, use Save Snapshot to create one")
+            return {'FINISHED'}
+
+        # Flag collections in this file built from templates that changed,
+        # and unflag the ones flagged by an earlier check that no longer are
+        drifted = {
+            template_name_from_path(os.path.join(folder, diff['template']))
+            for diff in diffs
+        }
+        affected = []
+        for col in bpy.data.collections:
+            if col.name in drifted:
+                col.color_tag = 'COLOR_01'
+                col["frosty_drift"] = True
+                affected.append(col)
+            elif col.get("frosty_drift"):
+                col.color_tag = 'NONE'
+                del col["frosty_drift"]
+
+        lines = [f"Template drift: {folder} vs {baseline_folder or 'last snapshot'}"]
+        lines.extend(format_drift_report(diffs))
+        if affected:
+            lines.append("")
+            lines.append("Affected collections in this file:")
+            lines.extend(f"  {col.name}" for col in affected)
+
+        text = bpy.data.texts.get("Frosty Template Drift") or bpy.data.texts.new("Frosty Template Drift")
+        text.clear()
+        text.write("\n".join(lines) + "\n")
+        print("\n".join(lines))
+
+        message = f"{len(diffs)} of {len(entries)} templates drifted"
+        if affected:
+            message += f", {len(affected)} collections affected"
+        self.report({'WARNING'} if affected else {'INFO'}, f"{message} - see 'Frosty Template Drift' text ({elapsed:.2f}s)")
+        return {'FINISHED'}
+
+
+class FROSTY_OT_assign_mesh(Operator):
+    bl_idname = "frosty.assign_mesh"
+    bl_label = "Assign Mesh"
+    bl_description = "Assign selected mesh to this material slot"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    slot_index: IntProperty()
+
+    def execute(self, context):
+        settings = context.scene.frosty_lod_settings
+
+        if self.slot_index >= len(settings.material_slots):
+            self.report({'ERROR'}, "Invalid slot index")
+            return {'CANCELLED'}
+
+        slot = settings.material_slots[self.slot_index]
+
+        obj = context.active_object
+        if not obj or obj.type != 'MESH':
+            self.report({'ERROR'}, "Select a mesh object first")
+            return {'CANCELLED'}
+
+        slot.mesh_object = obj
+
+        # Move into template collection
+        template_col = get_template_collection(settings)
+        if template_col:
+            link_object_to_collection(obj, template_col)
+
+        # Auto-rename
+        if settings.auto_rename_meshes:
+            obj.name = f"{slot.name}:lod0"
+
+        self.report({'INFO'}, f"Assigned '{obj.name}' to slot '{slot.name}'")
+        return {'FINISHED'}
+
+
+class FROSTY_OT_rename_lods(Operator):
+    bl_idname = "frosty.rename_lods"
+    bl_label = "Rename LODs"
+    bl_description = "Rename assigned meshes to materialname:lodN format"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    @classmethod
+    def poll(cls, context):
+        settings = context.scene.frosty_lod_settings
+        return any(slot.mesh_object for slot in settings.material_slots)
+
+    def execute(self, context):
+        settings = context.scene.frosty_lod_settings
+        renamed_count = 0
+
+        for slot in settings.material_slots:
+            if not slot.mesh_object:
+                continue
+
+            new_name = f"{slot.name}:lod0"
+            if slot.mesh_object.name != new_name:
+                slot.mesh_object.name = new_name
+                renamed_count += 1
+
+        self.report({'INFO'}, f"Renamed {renamed_count} meshes")
+        return {'FINISHED'}
+
+
+class FROSTY_OT_fix_transforms(Operator):
+    bl_idname = "frosty.fix_transforms"
+    bl_label = "Fix Transforms"
+    bl_description = "Fix transforms for Frosty import: unparent, apply transforms, rotate for engine axis, reparent"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    @classmethod
+    def poll(cls, context):
+        return any(obj.type == 'MESH' for obj in context.selected_objects)
+
+    def execute(self, context):
+        selected_meshes = [obj for obj in context.selected_objects if obj.type == 'MESH']
+
+        if not selected_meshes:
+            self.report({'ERROR'}, "No mesh objects selected")
+            return {'CANCELLED'}
+
+        # Find all armatures associated with selected meshes
+        armatures = set()
+        mesh_armature_map = {}
+        for obj in selected_meshes:
+            arm = find_armature(obj)
+            if arm:
+                armatures.add(arm)
+                mesh_armature_map[obj] = arm
+
+        all_objects = list(selected_meshes) + list(armatures)
+
+        # Step 1: Unparent meshes (keep transform)
+        bpy.ops.object.select_all(action='DESELECT')
+        for obj in selected_meshes:
+            if obj.parent:
+                obj.select_set(True)
+        if context.selected_objects:
+            context.view_layer.objects.active = context.selected_objects[0]
+            bpy.ops.object.parent_clear(type='CLEAR_KEEP_TRANSFORM')
+
+        # Step 2: Apply rotation, scale, and location on all objects
+        bpy.ops.object.select_all(action='DESELECT')
+        for obj in all_objects:
+            obj.select_set(True)
+        if all_objects:
+            context.view_layer.objects.active = all_objects[0]
+            bpy.ops.object.transform_apply(location=True, rotation=True, scale=True)
+
+        # Step 3: Rotate X by -90 degrees
+        for obj in all_objects:
+            obj.rotation_euler[0] = math.radians(-90)
+
+        # Step 4: Apply rotation
+        bpy.ops.object.transform_apply(location=False, rotation=True, scale=False)
+
+        # Step 5: Rotate X by +90 degrees
+        for obj in all_objects:
+            obj.rotation_euler[0] = math.radians(90)
+
+        # Step 6: Re-parent meshes to their armatures
+        for mesh_obj, arm in mesh_armature_map.items():
+            bpy.ops.object.select_all(action='DESELECT')
+            mesh_obj.select_set(True)
+            arm.select_set(True)
+            context.view_layer.objects.active = arm
+            bpy.ops.object.parent_set(type='ARMATURE')
+
+        # Restore selection
+        bpy.ops.object.select_all(action='DESELECT')
+        for obj in selected_meshes:
+            obj.select_set(True)
+        if selected_meshes:
+            context.view_layer.objects.active = selected_meshes[0]
+
+        self.report({'INFO'}, f"Fixed transforms for {len(selected_meshes)} meshes and {len(armatures)} armatures")
+        return {'FINISHED'}
+
+
+class FROSTY_OT_export_fbx(Operator):
+    bl_idname = "frosty.export_fbx"
+    bl_label = "Export FBX"
+    bl_description = "Export meshes to FBX for import into Frosty Editor"
+
+    @classmethod
+    def poll(cls, context):
+        settings = context.scene.frosty_lod_settings
+        return len(get_meshes_from_template_collection(settings)) > 0
+
+    def execute(self, context):
+        settings = context.scene.frosty_lod_settings
+        lod_objects = get_meshes_from_template_collection(settings)
+
+        view_layer_objects = set(context.view_layer.objects)
+        lod_objects = [obj for obj in lod_objects if obj in view_layer_objects]
+
+        if not lod_objects:
+            self.report({'ERROR'}, "No meshes to export")
+            return {'CANCELLED'}
+
+        # Find armatures
+        armatures = set()
+        for obj in lod_objects:
+            arm = find_armature(obj)
+            if arm and arm in view_layer_objects:
+                armatures.add(arm)
+
+        # Create export directory
+        export_dir = bpy.path.abspath(settings.export_path)
+        os.makedirs(export_dir, exist_ok=True)
+
+        filepath = os.path.join(export_dir, f"{settings.export_name or 'mesh'}.fbx")
+
+        vertex_format = None
+        if settings.prune_attributes:
+            vertex_format = get_export_vertex_format(settings)
+            if vertex_format is None:
+                self.report({'WARNING'}, "Template has no vertex format or profile, exporting all attributes")
+            else:
+                uv_channels = vertex_format['uv_channels']
+                color_channels = vertex_format['color_channels']
+                print(f"[FrostyMeshTools] Vertex format ({vertex_format['source']}): "
+                      f"{'all' if uv_channels is None else uv_channels} UV, "
+                      f"{'all' if color_channels is None else color_channels} color")
+
+        # Export temporary copies built from the evaluated meshes, never the user's meshes
+        temp_col = bpy.data.collections.new("FrostyExportTemp")
+        context.scene.collection.children.link(temp_col)
+        copies = create_export_copies(lod_objects, temp_col)
+        total_triangles = 0
+        total_saved = 0
+        total_before = total_after = 0
+        try:
+            # Snapshots are served from the cache when the objects are unchanged
+            groups, cached_count = get_export_snapshots(context, copies, share=settings.share_mesh_data)
+            shared_count = len(copies) - len(groups)
+            print(f"[FrostyMeshTools] Evaluated meshes: {cached_count} of {len(groups)} from cache")
+
+            for snapshot, users in groups:
+                label = ", ".join(get_slot_label(settings, obj) for obj in users)
+                triangle_count = len(snapshot['triangles'])
+                if not triangle_count:
+                    self.report({'WARNING'}, f"'{label}' has no faces after modifiers")
+                total_triangles += triangle_count * len(users)
+
+                attribute_indices, saved = select_export_attributes(snapshot, vertex_format)
+                total_saved += saved
+
+                if settings.weld_on_export:
+                    snapshot, before, after = weld_snapshot(snapshot, attribute_indices, settings.weld_epsilon)
+                    total_before += before * len(users)
+                    total_after += after * len(users)
+                    self.report({'INFO'}, f"{label}: {before} -> {after} vertices after welding")
+
+                mesh, used_vertices = build_export_mesh(copies[users[0]][1], snapshot, attribute_indices)
+                assign_export_mesh(copies, users, mesh, snapshot, used_vertices)
+
+                print(f"[FrostyMeshTools] {label}: {len(used_vertices)} vertices, {triangle_count} triangles"
+                      + (f", pruned {format_bytes(saved)}" if vertex_format is not None else ""))
+
+            export_objects = [copy for copy, name in copies.values()]
+
+            # Select objects for export
+            bpy.ops.object.select_all(action='DESELECT')
+            for obj in export_objects:
+                obj.select_set(True)
+            for arm in armatures:
+                arm.select_set(True)
+
+            context.view_layer.objects.active = export_objects[0]
+
+            # Export FBX with Frosty-compatible settings
+            bpy.ops.export_scene.fbx(
+                filepath=filepath,
+                use_selection=True,
+                apply_scale_options='FBX_SCALE_ALL',
+                global_scale=settings.export_scale,
+                use_mesh_modifiers=True,
+                mesh_smooth_type='FACE',
+                # The copies are already triangulated, which lets instances share geometry
+                use_triangles=False,
+                use_tspace=True,
+                add_leaf_bones=False,
+                bake_anim=False,
+                use_armature_deform_only=True,
+                primary_bone_axis='Y',
+                secondary_bone_axis='X',
+            )
+        finally:
+            remove_export_copies(copies)
+            bpy.data.collections.remove(temp_col)
+
+            # Leave the originals selected, as when exporting them directly
+            for obj in lod_objects:
+                obj.select_set(True)
+            context.view_layer.objects.active = lod_objects[0]
+
+        message = f"Exported {len(lod_objects)} meshes ({total_triangles} triangles) to: {filepath}"
+        if shared_count:
+            message += f" - {shared_count} served from shared data"
+        if cached_count:
+            message += f" - {cached_count} of {len(groups)} evaluated meshes from cache"
+        if vertex_format is not None:
+            message += f" - pruned {format_bytes(total_saved)} of unused attributes"
+        if settings.weld_on_export:
+            message += f" - welded {total_before} -> {total_after} vertices"
+        self.report({'INFO'}, message)
+        return {'FINISHED'}
+
+
+class FROSTY_OT_open_docs(Operator):
+    bl_idname = "frosty.open_docs"
+    bl_label = "Open Documentation"
+    bl_description = "Open online documentation"
+
+    def execute(self, context):
+        import webbrowser
+        webbrowser.open("https://github.com/claymcdonald/frosty-mesh-tools/wiki")
+        return {'FINISHED'}
+
+
+# ============================================================================
+# UI PANEL
+# ============================================================================
+
+class FROSTY_PT_main(Panel):
+    bl_label = "Frosty Mesh Tools"
+    bl_idname = "FROSTY_PT_main"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_category = "Frosty Mesh"
+
+    def draw(self, context):
+        layout = self.layout
+        settings = context.scene.frosty_lod_settings
+
+        # Tab selector
+        row = layout.row(align=True)
+        row.prop(settings, "active_tab", expand=True)
+
+        layout.separator()
+
+        if settings.active_tab == 'TEMPLATE':
+            self.draw_template_tab(layout, context, settings)
+        elif settings.active_tab == 'RENAME':
+            self.draw_rename_tab(layout, context, settings)
+        elif settings.active_tab == 'TRANSFORM':
+            self.draw_transform_tab(layout, context, settings)
+        elif settings.active_tab == 'EXPORT':
+            self.draw_export_tab(layout, context, settings)
+
+    def draw_template_tab(self, layout, context, settings):
+        # Template folder
+        box = layout.box()
+        box.label(text="Templates Folder", icon='FILE_FOLDER')
+        box.prop(settings, "samples_folder", text="")
+
+        if settings.samples_folder:
+            box.prop(settings, "selected_sample", text="")
+
+        layout.separator()
+
+        # Manual load
+        box = layout.box()
+        box.label(text="Or Load Directly", icon='IMPORT')
+        box.operator("frosty.load_template", text="Browse mesh.res...", icon='FILEBROWSER')
+
+        if settings.template_name:
+            layout.separator()
+            box = layout.box()
+            box.label(text=f"Loaded: {settings.template_name}", icon='CHECKMARK')
+            box.label(text=f"Materials: {len(settings.material_slots)}")
+            box.label(text=f"Collection: {settings.template_name}", icon='OUTLINER_COLLECTION')
+
+        if settings.samples_folder:
+            layout.separator()
+            box = layout.box()
+            box.label(text="Patch Drift Check", icon='FILE_REFRESH')
+            box.prop(settings, "drift_baseline_folder")
+            row = box.row(align=True)
+            row.operator("frosty.check_template_drift", text="Check Drift", icon='VIEWZOOM').update_snapshot = False
+            row.operator("frosty.check_template_drift", text="Save Snapshot", icon='FILE_TICK').update_snapshot = True
+
+    def draw_rename_tab(self, layout, context, settings):
+        if not settings.material_slots:
+            layout.label(text="Load a template first", icon='INFO')
+            return
+
+        # Material slots with assign buttons
+        box = layout.box()
+        box.label(text="Material Assignments", icon='MATERIAL')
+
+        for i, slot in enumerate(settings.material_slots):
+            row = box.row(align=True)
+
+            lod_info = f"[LOD {slot.min_lod}-{slot.max_lod}]"
+            row.label(text=f"{slot.name} {lod_info}")
+
+            if slot.mesh_object:
+                row.label(text=slot.mesh_object.name, icon='MESH_DATA')
+            else:
+                row.operator("frosty.assign_mesh", text="Assign", icon='ADD').slot_index = i
+
+        layout.separator()
+
+        # Auto-rename toggle
+        box = layout.box()
+        box.label(text="Naming", icon='SORTALPHA')
+        box.prop(settings, "auto_rename_meshes")
+
+        layout.separator()
+
+        # Rename button
+        col = layout.column(align=True)
+        col.scale_y = 1.5
+        col.operator("frosty.rename_lods", text="Rename All LODs", icon='SORTALPHA')
+
+    def draw_transform_tab(self, layout, context, settings):
+        box = layout.box()
+        box.label(text="Transform Fix", icon='OBJECT_DATA')
+
+        col = box.column(align=True)
+        col.scale_y = 0.8
+        col.label(text="Fixes transforms for Frosty import:")
+        col.label(text="1. Unparent meshes (keep transform)")
+        col.label(text="2. Apply all transforms")
+        col.label(text="3. Rotate X -90, apply, rotate X +90")
+        col.label(text="4. Re-parent to armature")
+
+        layout.separator()
+
+        selected_meshes = [obj for obj in context.selected_objects if obj.type == 'MESH']
+
+        col = layout.column(align=True)
+        col.scale_y = 1.5
+        col.operator("frosty.fix_transforms", text=f"Fix Transforms ({len(selected_meshes)} meshes)", icon='OBJECT_DATA')
+
+        if not selected_meshes:
+            layout.label(text="Select mesh objects first", icon='ERROR')
+
+    def draw_export_tab(self, layout, context, settings):
+        # Export settings
+        box = layout.box()
+        box.label(text="Export Settings", icon='EXPORT')
+        box.prop(settings, "export_path")
+        box.prop(settings, "export_name")
+        box.prop(settings, "export_scale")
+        box.prop(settings, "share_mesh_data")
+        box.prop(settings, "prune_attributes")
+
+        layout.separator()
+
+        # Mesh count
+        mesh_count = len(get_meshes_from_template_collection(settings))
+
+        # Vertex cleanup
+        box = layout.box()
+        box.label(text="Vertex Cleanup", icon='AUTOMERGE_ON')
+        box.prop(settings, "weld_on_export")
+        sub = box.row()
+        sub.enabled = settings.weld_on_export
+        sub.prop(settings, "weld_epsilon")
+
+        layout.separator()
+
+        # Export button
+        col = layout.column(align=True)
+        col.scale_y = 1.5
+        col.operator("frosty.export_fbx", text=f"Export FBX ({mesh_count} meshes)", icon='EXPORT')
+
+        if mesh_count == 0:
+            layout.label(text="No meshes in template collections", icon='ERROR')
+
+        # Workflow info
+        layout.separator()
+        box = layout.box()
+        box.label(text="Workflow:", icon='INFO')
+        col = box.column(align=True)
+        col.scale_y = 0.8
+        col.label(text="1. Export FBX")
+        col.label(text="2. In Frosty: Right-click MeshSet")
+        col.label(text="3. Import the exported FBX")
+
+
+# ============================================================================
+# REGISTRATION
+# ============================================================================
+
+classes = (
+    MaterialSlotItem,
+    FrostyLODSettings,
+    FrostyPreferences,
+    FROSTY_OT_load_template,
+    FROSTY_OT_check_template_drift,
+    FROSTY_OT_assign_mesh,
+    FROSTY_OT_rename_lods,
+    FROSTY_OT_fix_transforms,
+    FROSTY_OT_export_fbx,
+    FROSTY_OT_open_docs,
+    FROSTY_PT_main,
+)
+
+
+def register():
+    for cls in classes:
+        bpy.utils.register_class(cls)
+
+    bpy.types.Scene.frosty_lod_settings = PointerProperty(type=FrostyLODSettings)
+
+    bpy.app.handlers.depsgraph_update_post.append(on_depsgraph_update)
+    for handlers in (bpy.app.handlers.load_post, bpy.app.handlers.undo_post, bpy.app.handlers.redo_post):
+        handlers.append(on_file_or_undo)
+
+    print(f"Frosty Mesh Tools v{bl_info['version'][0]}.{bl_info['version'][1]}.{bl_info['version'][2]} registered")
+
+
+def unregister():
+    if on_depsgraph_update in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(on_depsgraph_update)
+    for handlers in (bpy.app.handlers.load_post, bpy.app.handlers.undo_post, bpy.app.handlers.redo_post):
+        if on_file_or_undo in handlers:
+            handlers.remove(on_file_or_undo)
+    on_file_or_undo()
+
+    del bpy.types.Scene.frosty_lod_settings
+
+    for cls in reversed(classes):
+        bpy.utils.unregister_class(cls)
@@ -0,0 +1,523 @@
+"""
+Frosty Mesh Tools core.
+
+Template scanning and mesh.res parsing with no Blender dependency, so it can
+be imported from plain Python (pool workers, command line tools) as well as
+from the addon.
+"""
+
+import hashlib
+import json
+import os
+import re
+import sys
+
+# ============================================================================
+# TEMPLATE SCANNING
+# ============================================================================
+
+def is_mesh_res_file(filepath):
+    """Check if file is a valid mesh.res (not a cloth asset)"""
+    if not os.path.exists(filepath):
+        return False
+    name = os.path.basename(filepath).lower()
+
+    if name == 'blocks.res':
+        return False
+    if 'clothwrap' in name or 'eacloth' in name:
+        return False
+    if not name.endswith('.res'):
+        return False
+
+    try:
+        with open(filepath, 'rb') as f:
+            data = f.read(100)
+        return b'\x00' in data and len(data) >= 50
+    except:
+        return False
+
+
+def scan_samples_folder(folder_path):
+    """Scan folder for mesh.res templates (excludes cloth assets)"""
+    samples = []
+    if not folder_path or not os.path.exists(folder_path):
+        return samples
+
+    for root, dirs, files in os.walk(folder_path):
+        for f in files:
+            filepath = os.path.join(root, f)
+            name_lower = f.lower()
+
+            if not name_lower.endswith('.res'):
+                continue
+            if name_lower == 'blocks.res':
+                continue
+            if 'clothwrap' in name_lower or 'eacloth' in name_lower:
+                continue
+            if 'cloth' in name_lower and 'asset' in name_lower:
+                continue
+
+            if name_lower.endswith('_mesh.res') or is_mesh_res_file(filepath):
+                rel_path = os.path.relpath(root, folder_path)
+                if rel_path == '.':
+                    display = os.path.splitext(f)[0]
+                else:
+                    display = rel_path.replace(os.sep, ' / ')
+                samples.append((display, filepath))
+
+    samples.sort(key=lambda x: x[0].lower())
+    return samples
+
+
+def template_name_from_path(filepath):
+    """Get the template (and collection) name for a mesh.res: its folder name, or its file name."""
+    folder_name = os.path.basename(os.path.dirname(filepath))
+    return folder_name or os.path.splitext(os.path.basename(filepath))[0]
+
+
+# ============================================================================
+# TEMPLATE PARSING
+# ============================================================================
+
+def parse_mesh_res(filepath, verbose=True):
+    """Extract material names and LOD info from mesh.res"""
+    with open(filepath, 'rb') as f:
+        data = f.read()
+
+    text = data.decode('latin-1', errors='ignore')
+
+    mesh_path_match = re.search(
+        r'(?:characters|vehicles|weapons|props)/[^\x00]+?(?=_lod|\x00)',
+        text
+    )
+    mesh_path = mesh_path_match.group(0) if mesh_path_match else ""
+
+    lod_sections = {}
+
+    for lod_match in re.finditer(r'Mesh:[^\x00]+?_lod(\d+)', text):
+        lod_num = int(lod_match.group(1))
+        pos = lod_match.start()
+
+        backward_text = text[max(0, pos - 300):pos]
+
+        for mat_match in re.finditer(r'([A-Za-z][A-Za-z0-9_]{2,})\x00', backward_text):
+            mat_name = mat_match.group(1)
+
+            if mat_name.lower() in {"mesh", "material", "shader", "lod", "model", "section", "bone", "vertex"}:
+                continue
+            if re.search(r'_lod\d+$', mat_name, re.IGNORECASE):
+                continue
+            if mat_name.isdigit():
+                continue
+
+            lod_sections.setdefault(lod_num, [])
+            if mat_name not in lod_sections[lod_num]:
+                lod_sections[lod_num].append(mat_name)
+
+    if not lod_sections:
+        for match in re.finditer(r'([A-Za-z0-9_]+)\x00', text):
+            mat_name = match.group(1)
+
+            if len(mat_name) < 3 or mat_name.isdigit():
+                continue
+            if re.search(r'_lod\d+$', mat_name, re.IGNORECASE):
+                continue
+            if mat_name.lower() in {"mesh", "material", "shader", "lod", "model"}:
+                continue
+
+            pos = match.start()
+            forward_text = text[pos:pos + 300]
+
+            lod_match = re.search(r'Mesh:[^\x00]+_lod(\d+)', forward_text)
+            if not lod_match:
+                lod_match = re.search(r'_[Ll][Oo][Dd](\d+)', forward_text)
+            if not lod_match:
+                continue
+
+            lod_num = int(lod_match.group(1))
+
+            lod_sections.setdefault(lod_num, [])
+            if mat_name not in lod_sections[lod_num]:
+                lod_sections[lod_num].append(mat_name)
+
+    material_info = {}
+    all_materials = set()
+
+    for materials in lod_sections.values():
+        all_materials.update(materials)
+
+    for mat in all_materials:
+        lods_with_mat = [lod for lod, mats in lod_sections.items() if mat in mats]
+        if lods_with_mat:
+            material_info[mat] = (min(lods_with_mat), max(lods_with_mat))
+
+    if material_info:
+        if verbose:
+            print(f"[FrostyMeshTools] Found {len(material_info)} materials:")
+            for mat, (min_l, max_l) in sorted(material_info.items()):
+                print(f"  {mat}: LOD {min_l}-{max_l}")
+    else:
+        if verbose:
+            print(f"[FrostyMeshTools] Warning: No materials with LOD info found in {filepath}")
+        fallback_mats = set()
+        for match in re.finditer(r'([A-Za-z][A-Za-z0-9_]{3,30})\x00', text):
+            name = match.group(1)
+            if name.lower() not in {"mesh", "material", "shader", "lod", "model", "section", "bone", "vertex", "index", "buffer", "texture", "normal", "tangent"}:
+                if not re.search(r'_lod\d+$|^lod\d+$', name, re.IGNORECASE):
+                    fallback_mats.add(name)
+
+        if fallback_mats:
+            if verbose:
+                print(f"[FrostyMeshTools] Using fallback - found {len(fallback_mats)} potential materials")
+            for mat in sorted(fallback_mats)[:20]:
+                material_info[mat] = (0, 4)
+
+    return material_info, lod_sections, mesh_path
+
+
+# ============================================================================
+# VERTEX FORMAT
+# ============================================================================
+
+def derive_vertex_format(filepath):
+    """Derive the UV and color channels a mesh.res consumes from its vertex element names.
+
+    A channel count is None (keep everything) for any kind of element the
+    template doesn't name. Returns None when it names neither.
+    """
+    with open(filepath, 'rb') as f:
+        text = f.read().decode('latin-1', errors='ignore')
+
+    # Only whole NUL-terminated strings, so material or section names such
+    # as "Hair_Color1" can't pass for vertex elements
+    uv_channels = {int(m.group(1)) for m in re.finditer(r'(?<=\x00)TexCoord(\d)(?=\x00)', text, re.IGNORECASE)}
+    color_channels = {int(m.group(1)) for m in re.finditer(r'(?<=\x00)Color(\d)(?=\x00)', text, re.IGNORECASE)}
+    if not uv_channels and not color_channels:
+        return None
+
+    return {
+        'uv_channels': max(uv_channels) + 1 if uv_channels else None,
+        'color_channels': max(color_channels) + 1 if color_channels else None,
+        'attributes': [],
+        'source': "template",
+    }
+
+
+def get_profile_path(filepath):
+    """Get the vertex format profile path for a template (next to the mesh.res)."""
+    return os.path.splitext(filepath)[0] + ".profile.json"
+
+
+def _optional_int(value):
+    return None if value is None else int(value)
+
+
+def load_vertex_profile(filepath):
+    """Load a template's vertex format profile, or None if it has none.
+
+    Profiles are JSON: {"uv_channels": 2, "color_channels": 1, "attributes": []}
+    A channel left out of the profile is kept in full.
+    """
+    profile_path = get_profile_path(filepath)
+    if not os.path.exists(profile_path):
+        return None
+
+    with open(profile_path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+
+    return {
+        'uv_channels': _optional_int(data.get('uv_channels')),
+        'color_channels': _optional_int(data.get('color_channels')),
+        'attributes': [str(name) for name in data.get('attributes', [])],
+        'source': "profile",
+    }
+
+
+def resolve_vertex_format(filepath):
+    """Get a template's vertex format from the template itself, falling back to its profile."""
+    if not filepath or not os.path.exists(filepath):
+        return None
+    return derive_vertex_format(filepath) or load_vertex_profile(filepath)
+
+
+# ============================================================================
+# TEMPLATE FINGERPRINTS
+# ============================================================================
+
+FINGERPRINT_STORE_NAME = ".frosty_fingerprints.json"
+FINGERPRINT_CACHE_NAME = ".frosty_fingerprint_cache.json"
+FINGERPRINT_STORE_VERSION = 1
+
+
+def fingerprint_template(filepath):
+    """Parse a template into a JSON-serializable fingerprint of its materials and LODs."""
+    try:
+        material_info, lod_sections, mesh_path = parse_mesh_res(filepath, verbose=False)
+    except Exception as e:
+        return {'error': str(e)}
+
+    fingerprint = {
+        'mesh_path': mesh_path,
+        'materials': {mat: list(lods) for mat, lods in sorted(material_info.items())},
+        'lod_sections': {str(lod): sorted(mats) for lod, mats in sorted(lod_sections.items())},
+    }
+    encoded = json.dumps(fingerprint, sort_keys=True).encode('utf-8')
+    fingerprint['digest'] = hashlib.sha1(encoded).hexdigest()
+    return fingerprint
+
+
+def _map_parallel(func, items, max_workers=None):
+    """Map func over items in worker processes, falling back to serial."""
+    if max_workers == 1 or len(items) < 16:
+        return [func(item) for item in items]
+
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    try:
+        # Spawn rather than fork, forking a running Blender is unsafe
+        with ProcessPoolExecutor(max_workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+            return list(pool.map(func, items, chunksize=32))
+    except (OSError, RuntimeError) as e:
+        print(f"[FrostyMeshTools] Parallel fingerprinting unavailable ({e}), continuing serially")
+        return [func(item) for item in items]
+
+
+def fingerprint_folder(folder_path, store=None, max_workers=None):
+    """Fingerprint every template in a folder, keyed by path relative to the folder.
+
+    Entries in store whose file size and modification time still match are
+    reused, the rest are parsed in parallel.
+    """
+    store = store or {}
+    entries = {}
+    pending = []
+
+    for display, filepath in scan_samples_folder(folder_path):
+        rel_path = os.path.relpath(filepath, folder_path).replace(os.sep, '/')
+        stat = os.stat(filepath)
+        previous = store.get(rel_path)
+        if previous and previous['mtime'] == stat.st_mtime_ns and previous['size'] == stat.st_size:
+            entries[rel_path] = previous
+        else:
+            pending.append((rel_path, filepath, stat))
+
+    fingerprints = _map_parallel(fingerprint_template, [filepath for _, filepath, _ in pending], max_workers)
+    for (rel_path, filepath, stat), fingerprint in zip(pending, fingerprints):
+        entries[rel_path] = {
+            'mtime': stat.st_mtime_ns,
+            'size': stat.st_size,
+            'fingerprint': fingerprint,
+        }
+
+    return entries
+
+
+def load_fingerprint_store(folder_path, name=FINGERPRINT_STORE_NAME):
+    """Load a folder's last fingerprint snapshot (or cache), or None if it has none."""
+    store_path = os.path.join(folder_path, name)
+    if not os.path.exists(store_path):
+        return None
+
+    try:
+        with open(store_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if data.get('version') != FINGERPRINT_STORE_VERSION:
+        return None
+    return data.get('templates', {})
+
+
+def save_fingerprint_store(folder_path, entries, name=FINGERPRINT_STORE_NAME):
+    """Save fingerprints as the folder's snapshot (or cache)."""
+    store_path = os.path.join(folder_path, name)
+    temp_path = store_path + ".tmp"
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump({'version': FINGERPRINT_STORE_VERSION, 'templates': entries}, f, indent=1, sort_keys=True)
+    os.replace(temp_path, store_path)
+
+
+def fingerprint_folder_cached(folder_path, cache_folder=None, max_workers=None):
+    """Fingerprint a folder, reusing and refreshing a fingerprint cache.
+
+    The cache only saves parsing time, unlike the snapshot it is rewritten
+    whenever a template changes. It lives in cache_folder (default: the
+    folder itself), keyed by folder, so a baseline folder can be cached
+    without ever writing into it. Read-only cache folders are skipped.
+    """
+    cache_folder = cache_folder or folder_path
+    if os.path.normcase(os.path.abspath(folder_path)) == os.path.normcase(os.path.abspath(cache_folder)):
+        key = "."
+    else:
+        key = os.path.abspath(folder_path)
+
+    caches = load_fingerprint_store(cache_folder, FINGERPRINT_CACHE_NAME) or {}
+    cache = caches.get(key)
+    entries = fingerprint_folder(folder_path, cache, max_workers)
+    if entries != cache:
+        caches[key] = entries
+        try:
+            save_fingerprint_store(cache_folder, caches, FINGERPRINT_CACHE_NAME)
+        except OSError as e:
+            print(f"[FrostyMeshTools] Could not save fingerprint cache in {cache_folder}: {e}")
+    return entries
+
+
+def diff_fingerprints(old_entries, new_entries):
+    """Compare two sets of template fingerprints.
+
+    Returns a list of per-template changes sorted by template path.
+    """
+    diffs = []
+
+    for rel_path in sorted(set(old_entries) | set(new_entries)):
+        old = old_entries.get(rel_path, {}).get('fingerprint')
+        new = new_entries.get(rel_path, {}).get('fingerprint')
+
+        if old is None:
+            diffs.append({'template': rel_path, 'status': 'added', 'materials_added': sorted(new.get('materials', {}))})
+            continue
+        if new is None:
+            diffs.append({'template': rel_path, 'status': 'removed', 'materials_removed': sorted(old.get('materials', {}))})
+            continue
+        if old.get('digest') == new.get('digest'):
+            continue
+
+        old_materials = old.get('materials', {})
+        new_materials = new.get('materials', {})
+        old_sections = old.get('lod_sections', {})
+        new_sections = new.get('lod_sections', {})
+        diff = {
+            'template': rel_path,
+            'status': 'changed',
+            'materials_added': sorted(set(new_materials) - set(old_materials)),
+            'materials_removed': sorted(set(old_materials) - set(new_materials)),
+            'lod_changes': {
+                mat: (old_materials[mat], new_materials[mat])
+                for mat in sorted(set(old_materials) & set(new_materials))
+                if old_materials[mat] != new_materials[mat]
+            },
+            'lod_sections': {
+                lod: (
+                    sorted(set(new_sections.get(lod, [])) - set(old_sections.get(lod, []))),
+                    sorted(set(old_sections.get(lod, [])) - set(new_sections.get(lod, []))),
+                )
+                for lod in sorted(set(old_sections) | set(new_sections), key=int)
+                if sorted(old_sections.get(lod, [])) != sorted(new_sections.get(lod, []))
+            },
+        }
+        if old.get('mesh_path') != new.get('mesh_path'):
+            diff['mesh_path'] = (old.get('mesh_path'), new.get('mesh_path'))
+        if 'error' in new:
+            diff['error'] = new['error']
+        diffs.append(diff)
+
+    return diffs
+
+
+def compare_template_folders(folder_path, baseline_folder=None, update=False, max_workers=None):
+    """Diff a template folder against a baseline folder, or against its own last snapshot.
+
+    Returns (diffs, entries). diffs is None when comparing against a
+    snapshot that doesn't exist yet. The snapshot is only written with
+    update, which makes the fresh fingerprints the folder's new snapshot.
+    """
+    entries = fingerprint_folder_cached(folder_path, max_workers=max_workers)
+
+    if baseline_folder:
+        # Cached alongside the templates folder, the baseline is never written to
+        baseline = fingerprint_folder_cached(baseline_folder, folder_path, max_workers)
+    else:
+        baseline = load_fingerprint_store(folder_path)
+
+    if update:
+        save_fingerprint_store(folder_path, entries)
+
+    if baseline is None:
+        return None, entries
+    return diff_fingerprints(baseline, entries), entries
+
+
+def format_drift_report(diffs):
+    """Format template diffs as report lines."""
+    counts = {status: sum(1 for d in diffs if d['status'] == status) for status in ('added', 'removed', 'changed')}
+    lines = [f"{counts['added']} added, {counts['removed']} removed, {counts['changed']} changed"]
+
+    for diff in diffs:
+        lines.append("")
+        lines.append(f"[{diff['status']}] {diff['template']}")
+        if 'error' in diff:
+            lines.append(f"  parse error: {diff['error']}")
+        if 'mesh_path' in diff:
+            old_path, new_path = diff['mesh_path']
+            lines.append(f"  mesh path: {old_path} -> {new_path}")
+        for mat in diff.get('materials_added', []):
+            lines.append(f"  + {mat}")
+        for mat in diff.get('materials_removed', []):
+            lines.append(f"  - {mat}")
+        for mat, ((old_min, old_max), (new_min, new_max)) in diff.get('lod_changes', {}).items():
+            lines.append(f"  ~ {mat}: LOD {old_min}-{old_max} -> LOD {new_min}-{new_max}")
+        for lod, (added, removed) in diff.get('lod_sections', {}).items():
+            changes = [f"+{mat}" for mat in added] + [f"-{mat}" for mat in removed]
+            lines.append(f"  LOD {lod}: {' '.join(changes)}")
+
+    return lines
+
+
+# ============================================================================
+# COMMAND LINE
+# ============================================================================
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog="frosty_mesh_tools.core",
+        description="Scan and parse Frosty mesh.res templates without Blender"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    scan_parser = subparsers.add_parser("scan", help="List mesh.res templates in a folder")
+    scan_parser.add_argument("folder")
+
+    parse_parser = subparsers.add_parser("parse", help="Print materials and LOD ranges of a mesh.res")
+    parse_parser.add_argument("filepath")
+
+    drift_parser = subparsers.add_parser(
+        "drift", help="Report material and LOD changes against a baseline folder or the last snapshot"
+    )
+    drift_parser.add_argument("folder")
+    drift_parser.add_argument("baseline", nargs="?", help="Older template folder (default: last snapshot)")
+    drift_parser.add_argument("--update", action="store_true", help="Save the folder's fingerprints as its new snapshot")
+    drift_parser.add_argument("--workers", type=int, default=None)
+
+    args = parser.parse_args(argv)
+
+    if args.command == "scan":
+        for display, filepath in scan_samples_folder(args.folder):
+            print(f"{display}\t{filepath}")
+    elif args.command == "parse":
+        if not is_mesh_res_file(args.filepath):
+            print(f"Not a valid mesh.res file: {args.filepath}", file=sys.stderr)
+            return 1
+        material_info, lod_sections, mesh_path = parse_mesh_res(args.filepath, verbose=False)
+        print(f"Mesh: {mesh_path}")
+        for mat, (min_l, max_l) in sorted(material_info.items()):
+            print(f"  {mat}: LOD {min_l}-{max_l}")
+    elif args.command == "drift":
+        diffs, entries = compare_template_folders(args.folder, args.baseline, args.update, args.workers)
+        if diffs is None:
+            if args.update:
+                print(f"Created snapshot of {len(entries)} templates")
+            else:
+                print(f"No snapshot of {args.folder} yet, run with --update to create one", file=sys.stderr)
+                return 1
+        else:
+            print("\n".join(format_drift_report(diffs)))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())